@@ -3,6 +3,8 @@ import json
 import shutil
 import tarfile
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import TYPE_CHECKING
@@ -200,6 +202,20 @@ class BaseFileComponent(Component, ABC):
         Returns:
             list[Data]: Parsed data from the processed files.
         """
+        with self._resolved_files() as final_files:
+            # Step 4: Process files
+            processed_files = self.process_files(final_files)
+
+            # Extract and flatten Data objects to return
+            return [data for file in processed_files for data in file.data if file.data]
+
+    @contextmanager
+    def _resolved_files(self) -> Iterator[list[BaseFile]]:
+        """Yields the validated and unpacked input files, cleaning up temporary files on exit.
+
+        Yields:
+            list[BaseFile]: Files ready to be processed.
+        """
         self._temp_dirs: list[TemporaryDirectory] = []
         final_files = []  # Initialize to avoid UnboundLocalError
         try:
@@ -212,11 +228,7 @@ class BaseFileComponent(Component, ABC):
             # Step 3: Final validation of file types
             final_files = self._filter_and_mark_files(all_files)
 
-            # Step 4: Process files
-            processed_files = self.process_files(final_files)
-
-            # Extract and flatten Data objects to return
-            return [data for file in processed_files for data in file.data if file.data]
+            yield final_files
 
         finally:
             # Delete temporary directories
@@ -1,11 +1,13 @@
+from functools import cache
+
 from langflow.base.models.model_input_constants import *
 from langflow.components.languagemodels.letsai_azure_openai import LetsAIAzureChatOpenAIComponent
 from langflow.components.languagemodels.azure_openai import AzureChatOpenAIComponent
-from copy import deepcopy
 
 
-# Override MODEL_PROVIDERS_DICT to replace Azure OpenAI with LetsAIAzureChatOpenAIComponent
-MODEL_PROVIDERS_DICT = deepcopy(MODEL_PROVIDERS_DICT)
+# Override MODEL_PROVIDERS_DICT to replace Azure OpenAI with LetsAIAzureChatOpenAIComponent.
+# Only top-level keys are added/removed here, so a shallow copy keeps the upstream dict intact.
+MODEL_PROVIDERS_DICT = dict(MODEL_PROVIDERS_DICT)
 try:
     azure_inputs = get_filtered_inputs(LetsAIAzureChatOpenAIComponent)
     azure_fields = create_input_fields_dict(azure_inputs, "")
@@ -13,7 +15,7 @@ try:
         "fields": azure_fields,
         "inputs": azure_inputs,
         "prefix": "",
-        "component_class": LetsAIAzureChatOpenAIComponent(),
+        "component_class_factory": LetsAIAzureChatOpenAIComponent,
         "icon": AzureChatOpenAIComponent.icon,
     }
     # Remove the original Azure OpenAI entry if it exists
@@ -24,8 +26,16 @@ except ImportError as e:
 
 # Update related variables
 MODEL_PROVIDERS = list(MODEL_PROVIDERS_DICT.keys())
-ALL_PROVIDER_FIELDS = [field for provider in MODEL_PROVIDERS_DICT.values() for field in provider["fields"]]
+ALL_PROVIDER_FIELDS = frozenset(field for provider in MODEL_PROVIDERS_DICT.values() for field in provider["fields"])
 MODELS_METADATA = {
     key: {"icon": MODEL_PROVIDERS_DICT[key]["icon"] if key in MODEL_PROVIDERS_DICT else None}
     for key in MODEL_PROVIDERS_DICT
-}
\ No newline at end of file
+}
+SORTED_MODEL_PROVIDERS = tuple(sorted(MODEL_PROVIDERS))
+SORTED_MODELS_METADATA = tuple(MODELS_METADATA[key] for key in sorted(MODELS_METADATA))
+
+
+@cache
+def get_component_class(provider: str):
+    """Instantiate the component for a provider registered with a ``component_class_factory`` on first use."""
+    return MODEL_PROVIDERS_DICT[provider]["component_class_factory"]()
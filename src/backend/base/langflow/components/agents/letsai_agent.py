@@ -1,3 +1,5 @@
+from collections.abc import Iterable
+
 from langchain_core.tools import StructuredTool
 from langflow.components.agents.agent import AgentComponent
 from langflow.base.agents.events import ExceptionWithMessageError
@@ -14,16 +16,49 @@ from langflow.schema.message import Message
 from typing_extensions import override
 from langflow.base.models.letsai_model_input_constants import (
     MODEL_PROVIDERS_DICT,
-    MODEL_PROVIDERS,
     ALL_PROVIDER_FIELDS,
     MODEL_DYNAMIC_UPDATE_FIELDS,
-    MODELS_METADATA,
+    SORTED_MODEL_PROVIDERS,
+    SORTED_MODELS_METADATA,
+    get_component_class,
 )
 
 def set_advanced_true(component_input):
     component_input.advanced = True
     return component_input
 
+
+# MemoryComponent.inputs is a class attribute, so no instance is needed to read it.
+_MEMORY_INPUTS = [set_advanced_true(component_input) for component_input in MemoryComponent.inputs]
+
+_CUSTOM_AGENT_LLM_INPUT = DropdownInput(
+    name="agent_llm",
+    display_name="Language Model",
+    options=[*SORTED_MODEL_PROVIDERS, "Custom"],
+    value="Custom",
+    real_time_refresh=True,
+    input_types=["LanguageModel"],
+    options_metadata=[*SORTED_MODELS_METADATA, {"icon": "brain"}],
+)
+_CUSTOM_AGENT_LLM_DICT = _CUSTOM_AGENT_LLM_INPUT.to_dict()
+
+_DEFAULT_AGENT_KEYS = frozenset(
+    {
+        "code",
+        "_type",
+        "agent_llm",
+        "tools",
+        "input_value",
+        "add_current_date_tool",
+        "system_prompt",
+        "agent_description",
+        "max_iterations",
+        "handle_parsing_errors",
+        "verbose",
+    }
+)
+
+
 class LetsAIAgentComponent(AgentComponent):
     """Custom Agent Component that uses a modified MODEL_PROVIDERS_DICT to include CustomAzureChatOpenAIComponent."""
 
@@ -31,18 +66,19 @@ class LetsAIAgentComponent(AgentComponent):
     description: str = "Define the agent's instructions, then enter a task to complete using tools."
     name = "LetsaiAgent"
 
-    memory_inputs = [set_advanced_true(component_input) for component_input in MemoryComponent().inputs]
+    memory_inputs = _MEMORY_INPUTS
+    _memory_input_names = tuple(component_input.name for component_input in memory_inputs)
 
     inputs = [
         DropdownInput(
             name="agent_llm",
             display_name="Model Provider",
             info="The provider of the language model that the agent will use to generate responses.",
-            options=[*sorted(MODEL_PROVIDERS), "Custom"],
+            options=[*SORTED_MODEL_PROVIDERS, "Custom"],
             value="OpenAI",
             real_time_refresh=True,
             input_types=[],
-            options_metadata=[MODELS_METADATA[key] for key in sorted(MODELS_METADATA.keys())] + [{"icon": "brain"}],
+            options_metadata=[*SORTED_MODELS_METADATA, {"icon": "brain"}],
         ),
         *MODEL_PROVIDERS_DICT["OpenAI"]["inputs"],
         MultilineInput(
@@ -65,6 +101,11 @@ class LetsAIAgentComponent(AgentComponent):
 
     outputs = [Output(name="response", display_name="Response", method="message_response")]
 
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        # (component class, prefix) -> names of provider inputs this agent exposes
+        self._resolved_input_names: dict[tuple[type, str], tuple[str, ...]] = {}
+
     @override
     async def message_response(self) -> Message:
         try:
@@ -79,11 +120,7 @@ class LetsAIAgentComponent(AgentComponent):
             if self.add_current_date_tool:
                 if not isinstance(self.tools, list):
                     self.tools = []
-                current_date_tool = (await CurrentDateComponent(**self.get_base_args()).to_toolkit()).pop(0)
-                if not isinstance(current_date_tool, StructuredTool):
-                    msg = "CurrentDateComponent must be converted to a StructuredTool"
-                    raise TypeError(msg)
-                self.tools.append(current_date_tool)
+                self.tools.append(await self._get_current_date_tool())
 
             # note the tools are not required to run the agent, hence the validation removed.
 
@@ -108,12 +145,24 @@ class LetsAIAgentComponent(AgentComponent):
             logger.error(f"Unexpected error: {e!s}")
             raise
 
+    async def _get_current_date_tool(self) -> StructuredTool:
+        """Build the current_date tool for this run.
+
+        The tool is bound to the run's tracing callbacks, so it must not be shared across runs.
+        """
+        current_date_tool = (await CurrentDateComponent(**self.get_base_args()).to_toolkit()).pop(0)
+        if not isinstance(current_date_tool, StructuredTool):
+            msg = "CurrentDateComponent must be converted to a StructuredTool"
+            raise TypeError(msg)
+        return current_date_tool
+
     @override
     async def get_memory_data(self):
-        memory_kwargs = {
-            component_input.name: getattr(self, f"{component_input.name}") for component_input in self.memory_inputs
-        }
-        memory_kwargs = {k: v for k, v in memory_kwargs.items() if v is not None}
+        memory_kwargs = {}
+        for name in self._memory_input_names:
+            value = getattr(self, name, None)
+            if value is not None:
+                memory_kwargs[name] = value
         return await MemoryComponent(**self.get_base_args()).set(**memory_kwargs).retrieve_messages()
 
     @override
@@ -127,7 +176,7 @@ class LetsAIAgentComponent(AgentComponent):
                 msg = f"Invalid model provider: {self.agent_llm}"
                 raise ValueError(msg)
 
-            component_class = provider_info.get("component_class")
+            component_class = provider_info.get("component_class") or get_component_class(self.agent_llm)
             display_name = component_class.display_name
             inputs = provider_info.get("inputs")
             prefix = provider_info.get("prefix", "")
@@ -141,10 +190,12 @@ class LetsAIAgentComponent(AgentComponent):
 
     @override
     def _build_llm_model(self, component, inputs, prefix=""):
-        model_kwargs = {}
-        for input_ in inputs:
-            if hasattr(self, f"{prefix}{input_.name}"):
-                model_kwargs[input_.name] = getattr(self, f"{prefix}{input_.name}")
+        key = (type(component), prefix)
+        input_names = self._resolved_input_names.get(key)
+        if input_names is None:
+            input_names = tuple(input_.name for input_ in inputs if hasattr(self, f"{prefix}{input_.name}"))
+            self._resolved_input_names[key] = input_names
+        model_kwargs = {name: getattr(self, f"{prefix}{name}") for name in input_names}
         return component.set(**model_kwargs).build_model()
 
     @override
@@ -158,7 +209,7 @@ class LetsAIAgentComponent(AgentComponent):
         return component
 
     @override
-    def delete_fields(self, build_config: dotdict, fields: dict | list[str]) -> None:
+    def delete_fields(self, build_config: dotdict, fields: Iterable[str]) -> None:
         for field in fields:
             build_config.pop(field, None)
 
@@ -180,27 +231,21 @@ class LetsAIAgentComponent(AgentComponent):
             build_config["agent_llm"]["value"] = field_value
             provider_info = MODEL_PROVIDERS_DICT.get(field_value)
             if provider_info:
-                component_class = provider_info.get("component_class")
+                component_class = provider_info.get("component_class") or get_component_class(field_value)
                 if component_class and hasattr(component_class, "update_build_config"):
                     build_config = await update_component_build_config(
                         component_class, build_config, field_value, "model_name"
                     )
 
-            provider_configs: dict[str, tuple[dict, list[dict]]] = {
-                provider: (
-                    MODEL_PROVIDERS_DICT[provider]["fields"],
-                    [
-                        MODEL_PROVIDERS_DICT[other_provider]["fields"]
-                        for other_provider in MODEL_PROVIDERS_DICT
-                        if other_provider != provider
-                    ],
-                )
-                for provider in MODEL_PROVIDERS_DICT
-            }
-            if field_value in provider_configs:
-                fields_to_add, fields_to_delete = provider_configs[field_value]
-                for fields in fields_to_delete:
-                    self.delete_fields(build_config, fields)
+            if field_value in MODEL_PROVIDERS_DICT:
+                fields_to_add = MODEL_PROVIDERS_DICT[field_value]["fields"]
+                fields_to_delete = [
+                    MODEL_PROVIDERS_DICT[provider]["fields"]
+                    for provider in MODEL_PROVIDERS_DICT
+                    if provider != field_value
+                ]
+                # Providers share field names (e.g. api_key), so drop each one only once.
+                self.delete_fields(build_config, set().union(*fields_to_delete))
                 if field_value == "OpenAI" and not any(field in build_config for field in fields_to_add):
                     build_config.update(fields_to_add)
                 else:
@@ -208,35 +253,13 @@ class LetsAIAgentComponent(AgentComponent):
                 build_config["agent_llm"]["input_types"] = []
             elif field_value == "Custom":
                 self.delete_fields(build_config, ALL_PROVIDER_FIELDS)
-                custom_component = DropdownInput(
-                    name="agent_llm",
-                    display_name="Language Model",
-                    options=[*sorted(MODEL_PROVIDERS), "Custom"],
-                    value="Custom",
-                    real_time_refresh=True,
-                    input_types=["LanguageModel"],
-                    options_metadata=[MODELS_METADATA[key] for key in sorted(MODELS_METADATA.keys())]
-                    + [{"icon": "brain"}],
-                )
-                build_config.update({"agent_llm": custom_component.to_dict()})
+                # Shallow copy: later calls reassign top-level keys such as "value" on this entry.
+                build_config.update({"agent_llm": dict(_CUSTOM_AGENT_LLM_DICT)})
             build_config = self.update_input_types(build_config)
 
-            default_keys = [
-                "code",
-                "_type",
-                "agent_llm",
-                "tools",
-                "input_value",
-                "add_current_date_tool",
-                "system_prompt",
-                "agent_description",
-                "max_iterations",
-                "handle_parsing_errors",
-                "verbose",
-            ]
-            missing_keys = [key for key in default_keys if key not in build_config]
+            missing_keys = _DEFAULT_AGENT_KEYS - build_config.keys()
             if missing_keys:
-                msg = f"Missing required keys in build_config: {missing_keys}"
+                msg = f"Missing required keys in build_config: {sorted(missing_keys)}"
                 raise ValueError(msg)
         if (
             isinstance(self.agent_llm, str)
@@ -245,7 +268,7 @@ class LetsAIAgentComponent(AgentComponent):
         ):
             provider_info = MODEL_PROVIDERS_DICT.get(self.agent_llm)
             if provider_info:
-                component_class = provider_info.get("component_class")
+                component_class = provider_info.get("component_class") or get_component_class(self.agent_llm)
                 component_class = self.set_component_params(component_class)
                 prefix = provider_info.get("prefix")
                 if component_class and hasattr(component_class, "update_build_config"):
@@ -1,10 +1,19 @@
+import atexit
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+
 from langflow.base.data import BaseFileComponent
-from langflow.base.data.utils import TEXT_FILE_TYPES, parallel_load_data, parse_text_file_to_data
+from langflow.base.data.utils import TEXT_FILE_TYPES, parse_text_file_to_data
 from langflow.io import BoolInput, IntInput, Output
 from langflow.schema import Data
 from langflow.schema.message import Message
 from typing_extensions import override
 
+# Shared across calls so each batch of files does not pay for spinning up its own pool.
+_FILE_POOL = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4), thread_name_prefix="letsai-file")
+atexit.register(_FILE_POOL.shutdown, wait=False)
+
 
 class LetsAIFileComponent(BaseFileComponent):
     """Custom File Component that extends file loading with path output functionality.
@@ -47,13 +56,34 @@ class LetsAIFileComponent(BaseFileComponent):
     def path_files(self) -> Message:
         """Load files and return their paths as a Message object.
 
+        Files are parsed in order only until one loads, rather than parsing every file up front.
+
         Returns:
-            Message: A Message containing the path of the first file.
+            Message: A Message containing the path of the first file that loads.
         """
-        data_list = self.load_files_base()
-        dict_list = [dict(item) for item in data_list]
-        paths = [item["data"]["file_path"] for item in dict_list if "data" in item and "file_path" in item["data"]]
-        return Message(data={"path": paths[0] if paths else ""})
+        with self._resolved_files() as files:
+            for file in files:
+                # With silent_errors, files that fail to parse are skipped as load_files_base would skip them.
+                if self._process_file(str(file.path), silent_errors=self.silent_errors) is not None:
+                    return Message(data={"path": str(file.path)})
+        return Message(data={"path": ""})
+
+    def _process_file(self, file_path: str, *, silent_errors: bool = False) -> Data | None:
+        """Processes a single file and returns its Data object."""
+        try:
+            return parse_text_file_to_data(file_path, silent_errors=silent_errors)
+        except FileNotFoundError as e:
+            msg = f"File not found: {file_path}. Error: {e}"
+            self.log(msg)
+            if not silent_errors:
+                raise
+            return None
+        except Exception as e:
+            msg = f"Unexpected error processing {file_path}: {e}"
+            self.log(msg)
+            if not silent_errors:
+                raise
+            return None
 
     @override
     def process_files(self, file_list: list[BaseFileComponent.BaseFile]) -> list[BaseFileComponent.BaseFile]:
@@ -65,23 +95,6 @@ class LetsAIFileComponent(BaseFileComponent):
         Returns:
             list[BaseFileComponent.BaseFile]: Updated list of files with merged data.
         """
-        def process_file(file_path: str, *, silent_errors: bool = False) -> Data | None:
-            """Processes a single file and returns its Data object."""
-            try:
-                return parse_text_file_to_data(file_path, silent_errors=silent_errors)
-            except FileNotFoundError as e:
-                msg = f"File not found: {file_path}. Error: {e}"
-                self.log(msg)
-                if not silent_errors:
-                    raise
-                return None
-            except Exception as e:
-                msg = f"Unexpected error processing {file_path}: {e}"
-                self.log(msg)
-                if not silent_errors:
-                    raise
-                return None
-
         if not file_list:
             msg = "No files to process."
             raise ValueError(msg)
@@ -93,15 +106,26 @@ class LetsAIFileComponent(BaseFileComponent):
         if concurrency < parallel_processing_threshold or file_count < parallel_processing_threshold:
             if file_count > 1:
                 self.log(f"Processing {file_count} files sequentially.")
-            processed_data = [process_file(str(file.path), silent_errors=self.silent_errors) for file in file_list]
+            processed_data = [
+                self._process_file(str(file.path), silent_errors=self.silent_errors) for file in file_list
+            ]
         else:
             self.log(f"Starting parallel processing of {file_count} files with concurrency: {concurrency}.")
-            file_paths = [str(file.path) for file in file_list]
-            processed_data = parallel_load_data(
-                file_paths,
-                silent_errors=self.silent_errors,
-                load_function=process_file,
-                max_concurrency=concurrency,
-            )
-
-        return self.rollup_data(file_list, processed_data)
\ No newline at end of file
+            # Keep at most `concurrency` files in flight on the shared pool; results stay in input order.
+            slots = threading.BoundedSemaphore(concurrency)
+            pending = []
+            try:
+                for file in file_list:
+                    slots.acquire()
+                    future = _FILE_POOL.submit(self._process_file, str(file.path), silent_errors=self.silent_errors)
+                    future.add_done_callback(lambda _: slots.release())
+                    pending.append(future)
+                processed_data = [future.result() for future in pending]
+            except BaseException:
+                # The caller deletes temporary files once this returns, so let running files finish first.
+                for future in pending:
+                    future.cancel()
+                wait(pending)
+                raise
+
+        return self.rollup_data(file_list, processed_data)
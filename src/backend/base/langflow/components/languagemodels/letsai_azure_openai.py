@@ -27,38 +27,22 @@ class LetsAIAzureChatOpenAIComponent(AzureChatOpenAIComponent):
     @override
     def build_model(self) -> LanguageModel:
         """Builds the AzureChatOpenAI model with optional JSON object response format."""
-        azure_endpoint = self.azure_endpoint
-        azure_deployment = self.azure_deployment
-        api_version = self.api_version
-        api_key = self.api_key
-        temperature = self.temperature
-        max_tokens = self.max_tokens
-        stream = self.stream
+        model_kwargs = {
+            "azure_endpoint": self.azure_endpoint,
+            "azure_deployment": self.azure_deployment,
+            "api_version": self.api_version,
+            "api_key": self.api_key,
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens or None,
+            "streaming": self.stream,
+        }
+        if self.json_object:
+            model_kwargs["response_format"] = {"type": "json_object"}
 
         try:
-            if self.json_object:
-                output = AzureChatOpenAI(
-                    azure_endpoint=azure_endpoint,
-                    azure_deployment=azure_deployment,
-                    api_version=api_version,
-                    api_key=api_key,
-                    temperature=temperature,
-                    max_tokens=max_tokens or None,
-                    streaming=stream,
-                    response_format={"type": "json_object"},
-                )
-            else:
-                output = AzureChatOpenAI(
-                    azure_endpoint=azure_endpoint,
-                    azure_deployment=azure_deployment,
-                    api_version=api_version,
-                    api_key=api_key,
-                    temperature=temperature,
-                    max_tokens=max_tokens or None,
-                    streaming=stream,
-                )
+            output = AzureChatOpenAI(**model_kwargs)
         except Exception as e:
             msg = f"Could not connect to AzureOpenAI API: {e}"
             raise ValueError(msg) from e
 
-        return output
\ No newline at end of file
+        return output
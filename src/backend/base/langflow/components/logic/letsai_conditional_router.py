@@ -1,4 +1,6 @@
+import operator as op
 import re
+from functools import lru_cache
 
 from langflow.components.logic.conditional_router import ConditionalRouterComponent
 from langflow.io import (
@@ -12,6 +14,28 @@ from langflow.io import (
 from langflow.schema.message import Message
 
 
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> re.Pattern:
+    return re.compile(pattern)
+
+
+def _regex_match(input_text: str, pattern: str) -> bool:
+    try:
+        return _compile_pattern(pattern).match(input_text) is not None
+    except re.error:
+        return False  # Return False if the regex is invalid
+
+
+_OPERATORS = {
+    "equals": op.eq,
+    "not equals": op.ne,
+    "contains": op.contains,
+    "starts with": str.startswith,
+    "ends with": str.endswith,
+    "regex": _regex_match,
+}
+
+
 class LetsAIConditionalRouterComponent(ConditionalRouterComponent):
     """
     A conditional router component for Langflow, extending the original ConditionalRouterComponent.
@@ -44,13 +68,40 @@ class LetsAIConditionalRouterComponent(ConditionalRouterComponent):
         Output(display_name="False", name="false_result", method="false_response", group_outputs=True),
     ]
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._last_eval_key = None
+        self._last_eval = None
+
+    def evaluate_condition(self, input_text: str, match_text: str, operator: str, *, case_sensitive: bool) -> bool:
+        """
+        Same semantics as the parent, dispatched through a lookup table with cached regex compilation.
+        """
+        compare = _OPERATORS.get(operator)
+        if compare is None:
+            return False
+        if not case_sensitive and operator != "regex":
+            input_text = input_text.lower()
+            match_text = match_text.lower()
+        return compare(input_text, match_text)
+
+    def _evaluate_once(self) -> bool:
+        """
+        Evaluates the condition, reusing the previous result when both outputs run on the same inputs.
+        """
+        key = (self.input_text, self.match_text, self.operator, self.case_sensitive)
+        if key != self._last_eval_key:
+            self._last_eval = self.evaluate_condition(
+                self.input_text, self.match_text, self.operator, case_sensitive=self.case_sensitive
+            )
+            self._last_eval_key = key
+        return self._last_eval
+
     def true_response(self) -> Message:
         """
         Returns the true_output if condition is True, else fallback or message.
         """
-        result = self.evaluate_condition(
-            self.input_text, self.match_text, self.operator, case_sensitive=self.case_sensitive
-        )
+        result = self._evaluate_once()
         if result:
             self.status = self.true_output
             self.log(f"Condition met. Routing to True: {self.true_output}")
@@ -65,9 +116,7 @@ class LetsAIConditionalRouterComponent(ConditionalRouterComponent):
         """
         Returns the false_output if condition is False, else fallback or message.
         """
-        result = self.evaluate_condition(
-            self.input_text, self.match_text, self.operator, case_sensitive=self.case_sensitive
-        )
+        result = self._evaluate_once()
         if not result:
             self.status = self.false_output
             self.log(f"Condition NOT met. Routing to False: {self.false_output}")
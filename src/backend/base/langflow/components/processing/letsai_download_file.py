@@ -1,11 +1,13 @@
+import csv
 from uuid import UUID
-from io import BytesIO
-import json
-from collections.abc import AsyncIterator, Iterator
-from pathlib import Path
+from io import BytesIO, StringIO
+from tempfile import SpooledTemporaryFile
+from typing import BinaryIO
 
 import orjson
 import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pacsv
 from fastapi import UploadFile
 from fastapi.encoders import jsonable_encoder
 
@@ -17,15 +19,53 @@ from langflow.services.auth.utils import create_user_longterm_token
 from langflow.services.database.models.user.crud import get_user_by_id
 from langflow.services.deps import get_session, get_settings_service, get_storage_service
 from langflow.template.field.base import Output
-import markdown
-from docx import Document
 
-# try:
-#     from weasyprint import HTML
-# except ImportError as e:
-#     msg = "Could not import weasyprint. Please install it with `pip install weasyprint`."
-#     raise ImportError(msg) from e
+# xlsxwriter writes noticeably faster than openpyxl; fall back when it is not installed.
+try:
+    import xlsxwriter  # noqa: F401
 
+    EXCEL_ENGINE = "xlsxwriter"
+except ImportError:
+    EXCEL_ENGINE = "openpyxl"
+
+# Shared across exports so WeasyPrint does not reload fonts on every PDF. Images stay in WeasyPrint's
+# per-render cache: they come from user Markdown, so a process-wide cache would only grow.
+# WeasyPrint is imported on the first PDF export because loading it (cairo/pango, font scan) is slow.
+_FONT_CONFIG = None
+
+# Exports stay in memory up to this size and spill to a temporary file beyond it. Once spilled,
+# UploadFile.read() runs in a worker thread, so large exports do not block the event loop.
+SPOOL_MAX_SIZE = 16 * 1024 * 1024
+CSV_CHUNK_SIZE = 50_000
+# Arrow formats floats, booleans and timestamps differently from pandas, so only these columns take the Arrow path.
+_ARROW_CSV_OPTIONS = pacsv.WriteOptions(include_header=False, quoting_style="none")
+
+
+def _is_plain_csv_type(arrow_type: pa.DataType) -> bool:
+    return (
+        pa.types.is_integer(arrow_type)
+        or pa.types.is_string(arrow_type)
+        or pa.types.is_large_string(arrow_type)
+        or pa.types.is_null(arrow_type)
+    )
+
+
+# Above this many rows, Markdown tables skip tabulate's per-cell padding.
+MARKDOWN_TABULATE_MAX_ROWS = 10_000
+
+
+def _get_weasyprint():
+    """Import WeasyPrint lazily and return its HTML class with the shared font configuration."""
+    global _FONT_CONFIG  # noqa: PLW0603
+    try:
+        from weasyprint import HTML
+        from weasyprint.text.fonts import FontConfiguration
+    except ImportError as e:
+        msg = "Could not import weasyprint. Please install it with `pip install weasyprint`."
+        raise ImportError(msg) from e
+    if _FONT_CONFIG is None:
+        _FONT_CONFIG = FontConfiguration()
+    return HTML, _FONT_CONFIG
 
 
 class LetsAISaveToFileComponent(SaveToFileComponent):
@@ -56,7 +96,10 @@ class LetsAISaveToFileComponent(SaveToFileComponent):
             name="file_format",
             display_name="File Format",
             options=list(dict.fromkeys(SaveToFileComponent.DATA_FORMAT_CHOICES + MESSAGE_FORMAT_CHOICES)),
-            info="Select the file format. Defaults based on input type.",
+            info=(
+                "Select the file format. Defaults based on input type. "
+                f"Markdown tables over {MARKDOWN_TABULATE_MAX_ROWS:,} rows are written without column padding."
+            ),
             value="",
         ),
     ]
@@ -69,7 +112,7 @@ class LetsAISaveToFileComponent(SaveToFileComponent):
             raise ValueError("File name must be provided.")
 
         input_type = self._get_input_type()
-        file_format = self.file_format or self._get_default_format()
+        file_format = self.file_format or self._get_default_format(input_type)
 
         allowed_formats = (
             self.MESSAGE_FORMAT_CHOICES if input_type == "Message" else self.DATA_FORMAT_CHOICES
@@ -77,79 +120,142 @@ class LetsAISaveToFileComponent(SaveToFileComponent):
         if file_format not in allowed_formats:
             raise ValueError(f"Invalid file format '{file_format}' for {input_type}. Allowed: {allowed_formats}")
 
-        file_bytes, filename = await self._generate_file_content(self.input, input_type, file_format)
-        upload_file = UploadFile(filename=filename, file=BytesIO(file_bytes), size=len(file_bytes))
-        file_id = await self._upload_in_memory_file(upload_file)
+        with SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as buffer:
+            payload, filename = await self._generate_file_content(self.input, input_type, file_format, buffer)
+            if payload is not None:
+                # BytesIO wraps the encoded payload without copying it.
+                upload_file = UploadFile(filename=filename, file=BytesIO(payload), size=len(payload))
+            else:
+                size = buffer.tell()
+                buffer.seek(0)
+                upload_file = UploadFile(filename=filename, file=buffer, size=size)
+            file_id = await self._upload_in_memory_file(upload_file)
 
         return Message(text=f"[Click here to download](/api/v2/files/{file_id})")
 
-    async def _generate_file_content(self, input_data, input_type: str, fmt: str) -> tuple[bytes, str]:
-        """Generate file content in memory based on input type and format."""
-        filename = f"{self.file_name}.{fmt if fmt != 'excel' else 'xlsx'}"
+    async def _generate_file_content(
+        self, input_data, input_type: str, fmt: str, buffer: BinaryIO
+    ) -> tuple[bytes | None, str]:
+        """Generate file content based on input type and format.
+
+        Single-shot text formats are returned as bytes; writer-based formats are written into `buffer`
+        and return None instead.
+        """
+        filename = f"{self.file_name}.{self._get_file_extension(fmt)}"
         if input_type == "DataFrame":
-            return self._generate_from_dataframe(input_data, fmt), filename
+            return self._generate_from_dataframe(input_data, fmt, buffer), filename
         elif input_type == "Data":
-            return self._generate_from_data(input_data, fmt), filename
+            return self._generate_from_data(input_data, fmt, buffer), filename
         elif input_type == "Message":
-            return await self._generate_from_message(input_data, fmt), filename
+            return await self._generate_from_message(input_data, fmt, buffer), filename
         else:
             raise ValueError(f"Unsupported input type: {input_type}")
 
-    def _generate_from_dataframe(self, df: DataFrame, fmt: str) -> bytes:
+    def _generate_from_dataframe(self, df: DataFrame, fmt: str, buffer: BinaryIO) -> bytes | None:
         """Generate file content from a DataFrame."""
-        buffer = BytesIO()
         if fmt == "csv":
-            df.to_csv(buffer, index=False)
+            self._write_csv(df, buffer)
         elif fmt == "excel":
-            with pd.ExcelWriter(buffer, engine="openpyxl") as writer:
+            with pd.ExcelWriter(buffer, engine=EXCEL_ENGINE) as writer:
                 df.to_excel(writer, index=False)
         elif fmt == "json":
-            buffer.write(df.to_json(orient="records", indent=2).encode("utf-8"))
+            return df.to_json(orient="records", indent=2).encode("utf-8")
         elif fmt == "markdown":
-            buffer.write(df.to_markdown(index=False).encode("utf-8"))
+            if len(df) > MARKDOWN_TABULATE_MAX_ROWS:
+                return self._to_pipe_table(df).encode("utf-8")
+            return df.to_markdown(index=False).encode("utf-8")
         else:
             raise ValueError(f"Unsupported format: {fmt}")
-        buffer.seek(0)
-        return buffer.read()
+        return None
 
-    def _generate_from_data(self, data: Data, fmt: str) -> bytes:
+    def _to_pipe_table(self, df: DataFrame) -> str:
+        """Render a Markdown pipe table column-wise, without tabulate's per-cell alignment."""
+        columns = [self._escape_pipe_cells(self._blank_missing(df.iloc[:, i])) for i in range(df.shape[1])]
+        names = self._escape_pipe_cells(pd.Series([str(name) for name in df.columns], dtype=object))
+        header = "| " + " | ".join(names) + " |"
+        separator = "|" + "|".join(["---"] * len(df.columns)) + "|"
+        if not columns:
+            return f"{header}\n{separator}"
+        # Join plain arrays so str.cat does not align on a possibly non-unique index.
+        rows = ("| " + columns[0].str.cat([column.to_numpy() for column in columns[1:]], sep=" | ") + " |").tolist()
+        return "\n".join([header, separator, *rows])
+
+    @staticmethod
+    def _blank_missing(values: pd.Series) -> pd.Series:
+        """Convert values to strings, leaving missing values empty as tabulate does."""
+        values = values.astype(object)
+        return values.where(values.notna(), "").astype(str)
+
+    @staticmethod
+    def _escape_pipe_cells(values: pd.Series) -> pd.Series:
+        """Escape pipes and flatten newlines so each value stays inside its table cell."""
+        return values.str.replace("|", "\\|", regex=False).str.replace("\n", " ", regex=False)
+
+    def _write_csv(self, df: DataFrame, buffer: BinaryIO) -> None:
+        """Write a DataFrame as CSV with pyarrow, falling back to pandas wherever their output would differ."""
+        start = buffer.tell()
+        try:
+            written = self._write_arrow_csv(df, buffer)
+        except (pa.ArrowException, TypeError, ValueError):
+            written = False
+        if not written:
+            buffer.seek(start)
+            buffer.truncate()
+            df.to_csv(buffer, index=False, chunksize=CSV_CHUNK_SIZE)
+
+    def _write_arrow_csv(self, df: DataFrame, buffer: BinaryIO) -> bool:
+        """Write integer and string columns with pyarrow; return False for frames pandas should write."""
+        # pandas quotes empty values in single-column frames so that rows are not blank lines,
+        # and writes one header row per level of MultiIndex columns.
+        if len(df.columns) < 2 or df.columns.nlevels > 1:  # noqa: PLR2004
+            return False
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        if not all(_is_plain_csv_type(field.type) for field in table.schema):
+            return False
+        # Arrow always quotes headers, so write the header the way pandas does.
+        header = StringIO()
+        csv.writer(header, lineterminator="\n").writerow(str(name) for name in df.columns)
+        buffer.write(header.getvalue().encode("utf-8"))
+        # Values that would need quoting make Arrow raise, and pandas quotes them instead.
+        pacsv.write_csv(table, buffer, write_options=_ARROW_CSV_OPTIONS)
+        return True
+
+    def _generate_from_data(self, data: Data, fmt: str, buffer: BinaryIO) -> bytes | None:
         """Generate file content from a Data object."""
+        if fmt == "json":
+            return orjson.dumps(jsonable_encoder(data.data), option=orjson.OPT_INDENT_2)
         df = pd.DataFrame(data.data)
-        return self._generate_from_dataframe(df, fmt)
+        return self._generate_from_dataframe(df, fmt, buffer)
 
-    async def _generate_from_message(self, msg: Message, fmt: str) -> bytes:
+    async def _generate_from_message(self, msg: Message, fmt: str, buffer: BinaryIO) -> bytes | None:
         """Generate file content from a Message, including PDF and DOCX support."""
-        content = ""
-        if msg.text is None:
-            content = ""
-        elif isinstance(msg.text, AsyncIterator):
-            async for item in msg.text:
-                content += str(item) + " "
-            content = content.strip()
-        elif isinstance(msg.text, Iterator):
-            content = " ".join(str(item) for item in msg.text)
-        else:
-            content = str(msg.text)
+        content = await self._get_message_text(msg)
 
-        buffer = BytesIO()
         if fmt == "txt":
-            buffer.write(content.encode("utf-8"))
+            return content.encode("utf-8")
         elif fmt == "json":
-            buffer.write(json.dumps({"message": content}, indent=2).encode("utf-8"))
+            return orjson.dumps({"message": content}, option=orjson.OPT_INDENT_2)
         elif fmt == "markdown":
-            buffer.write(f"**Message:**\n\n{content}".encode("utf-8"))
+            return f"**Message:**\n\n{content}".encode("utf-8")
         elif fmt == "pdf":
-            html_content = markdown.markdown(content)
-            pdf_bytes = HTML(string=html_content).write_pdf()
-            buffer.write(pdf_bytes)
+            self._render_pdf(content, buffer)
         elif fmt == "docx":
+            from docx import Document
+
             document = Document()
             document.add_paragraph(content)
             document.save(buffer)
         else:
             raise ValueError(f"Unsupported format: {fmt}")
-        buffer.seek(0)
-        return buffer.read()
+        return None
+
+    def _render_pdf(self, content: str, target: BinaryIO) -> None:
+        """Render Markdown content as PDF into `target` with WeasyPrint."""
+        import markdown
+
+        html_class, font_config = _get_weasyprint()
+        html_content = markdown.markdown(content)
+        html_class(string=html_content).write_pdf(target=target, font_config=font_config)
 
     async def _upload_in_memory_file(self, upload_file: UploadFile) -> UUID:
         """Upload the in-memory file to the storage service."""
@@ -1,10 +1,15 @@
 # src/backend/base/langflow/components/processing/prompt_parser.py
+import orjson
 from loguru import logger
 from langflow.custom import Component
 from langflow.io import MessageInput, Output
 from langflow.schema import Data
 from langflow.schema.message import Message
 
+# Constant error payloads are encoded once instead of on every call.
+_NO_PATHS_FOUND = orjson.dumps({"error": "No paths found"}).decode()
+_INVALID_MESSAGE = orjson.dumps({"error": "Invalid message"}).decode()
+
 
 class PromptParserComponent(Component):
     display_name = "LetsAI Prompt Parser"
@@ -26,32 +31,41 @@ class PromptParserComponent(Component):
         Output(display_name="Path", name="path", method="get_paths")  # Changed "file" to "path"
     ]
 
+    def _split_message(self) -> tuple[str, str]:
+        """Splits the message text once into the prompt and the raw paths section after the first pipe."""
+        text = self.message.text
+        cached = getattr(self, "_split_cache", None)
+        if cached is None or cached[0] is not text:
+            prompt, _, paths_str = text.partition("|")
+            cached = self._split_cache = (text, prompt, paths_str)
+        return cached[1], cached[2]
+
     def get_prompt(self) -> Message:
         """Extracts the prompt from the message."""
         if isinstance(self.message, Message):
             # Extracting the message text before the first pipe '|'
-            message_text = self.message.text.split('|')[0].strip()  # Get text before first pipe
-            return message_text
+            prompt, _ = self._split_message()  # Get text before first pipe
+            return prompt.strip()
         return "No prompt found"
 
     def get_paths(self) -> Message:
         """Returns the first path as a Message object."""
         if isinstance(self.message, Message):
-            paths_str = '|'.join(self.message.text.split('|')[1:]).strip()
-            paths = [path.strip().strip('"') for path in paths_str.split('|') if path.strip()]
-    
-            if paths:
-                return Message(text=json.dumps({"path": paths[0]}))
-            else:
-                return Message(text=json.dumps({"error": "No paths found"}))
-        return Message(text=json.dumps({"error": "Invalid message"}))
+            _, paths_str = self._split_message()
+            # Only the first path is returned, so stop scanning at the first non-blank segment.
+            for segment in paths_str.split("|"):
+                path = segment.strip()
+                if path:
+                    return Message(text=orjson.dumps({"path": path.strip('"')}).decode())
+            return Message(text=_NO_PATHS_FOUND)
+        return Message(text=_INVALID_MESSAGE)
 
     def get_file_paths(self) -> Data:
         """Generate file paths based on the file names."""
         if isinstance(self.message, Message):
             # Extract the file names and generate file paths
-            paths_str = '|'.join(self.message.text.split('|')[1:]).strip()
-            path_names = [path.strip() for path in paths_str.split('|') if path.strip()]
+            _, paths_str = self._split_message()
+            path_names = [path for path in (segment.strip() for segment in paths_str.split("|")) if path]
 
             # Generate file paths based on the path names
             file_paths = [f"/path/to/files/{path_name}" for path_name in path_names]
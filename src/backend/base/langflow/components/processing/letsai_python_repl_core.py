@@ -1,6 +1,9 @@
 import importlib
 import ast
+from functools import lru_cache
 from typing import Dict, Union, List
+
+import orjson
 from langchain_experimental.utilities import PythonREPL
 from langflow.inputs import DictInput, MessageTextInput
 from langflow.custom.custom_component.component import Component
@@ -8,6 +11,23 @@ from langflow.io import CodeInput, Output, StrInput
 from langflow.schema.data import Data
 from langflow.components.processing.python_repl_core import PythonREPLComponent
 
+
+@lru_cache(maxsize=32)
+def _resolve_imports(spec: str) -> tuple[tuple[str, object], ...]:
+    """
+    Import the comma-separated modules in `spec` once and cache the (name, module) pairs.
+    """
+    resolved = []
+    for module in (module.strip() for module in spec.split(",")):
+        if not module:
+            continue
+        try:
+            resolved.append((module, importlib.import_module(module)))
+        except ImportError as e:
+            raise ImportError(f"Could not import module '{module}': {str(e)}") from e
+    return tuple(resolved)
+
+
 class LetsAIPythonREPLComponent(PythonREPLComponent):
     """
     Custom Langflow Component that extends the PythonREPLComponent to provide a safe Python REPL
@@ -80,21 +100,16 @@ class LetsAIPythonREPLComponent(PythonREPLComponent):
             ImportError: If a module cannot be imported.
             TypeError: If global_imports is neither a string nor a list.
         """
-        global_dict = {}
         try:
             if isinstance(global_imports, str):
-                modules = [module.strip() for module in global_imports.split(",") if module.strip()]
+                spec = global_imports
             elif isinstance(global_imports, list):
-                modules = [module.strip() for module in global_imports if module.strip()]
+                spec = ",".join(global_imports)
             else:
                 raise TypeError("global_imports must be either a string or a list")
 
-            for module in modules:
-                try:
-                    imported_module = importlib.import_module(module)
-                    global_dict[module] = imported_module
-                except ImportError as e:
-                    raise ImportError(f"Could not import module '{module}': {str(e)}") from e
+            # A fresh dict each call, since the caller injects variables into it.
+            global_dict = dict(_resolve_imports(spec))
 
             self.log(f"[Imports] Successfully imported modules: {list(global_dict.keys())}")
             return global_dict
@@ -133,7 +148,10 @@ class LetsAIPythonREPLComponent(PythonREPLComponent):
             raw_input = self.dynamic_variable.strip()
             if raw_input:
                 try:
-                    parsed_data = ast.literal_eval(raw_input)  # Safer than eval for trusted inputs
+                    try:
+                        parsed_data = orjson.loads(raw_input)  # Fast path for plain JSON dicts
+                    except orjson.JSONDecodeError:
+                        parsed_data = ast.literal_eval(raw_input)  # Safer than eval for trusted inputs
                     if not isinstance(parsed_data, dict):
                         raise ValueError("[Validation Error] Parsed dynamic_variable is not a dictionary.")
                     globals_.update(parsed_data)
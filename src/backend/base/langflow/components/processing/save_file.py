@@ -26,6 +26,7 @@ class SaveToFileComponent(Component):
     # File format options for different types
     DATA_FORMAT_CHOICES = ["csv", "excel", "json", "markdown"]
     MESSAGE_FORMAT_CHOICES = ["txt", "json", "markdown"]
+    _INPUT_TYPE_NAMES = {DataFrame: "DataFrame", Message: "Message", Data: "Data"}
 
     inputs = [
         HandleInput(
@@ -60,17 +61,18 @@ class SaveToFileComponent(Component):
         if not self.file_name:
             msg = "File name must be provided."
             raise ValueError(msg)
-        if not self._get_input_type():
+        input_type = self._get_input_type()
+        if not input_type:
             msg = "Input type is not set."
             raise ValueError(msg)
 
         # Validate file format based on input type
-        file_format = self.file_format or self._get_default_format()
+        file_format = self.file_format or self._get_default_format(input_type)
         allowed_formats = (
-            self.MESSAGE_FORMAT_CHOICES if self._get_input_type() == "Message" else self.DATA_FORMAT_CHOICES
+            self.MESSAGE_FORMAT_CHOICES if input_type == "Message" else self.DATA_FORMAT_CHOICES
         )
         if file_format not in allowed_formats:
-            msg = f"Invalid file format '{file_format}' for {self._get_input_type()}. Allowed: {allowed_formats}"
+            msg = f"Invalid file format '{file_format}' for {input_type}. Allowed: {allowed_formats}"
             raise ValueError(msg)
 
         # Prepare file path
@@ -80,14 +82,14 @@ class SaveToFileComponent(Component):
         file_path = self._adjust_file_path_with_format(file_path, file_format)
 
         # Save the input to file based on type
-        if self._get_input_type() == "DataFrame":
+        if input_type == "DataFrame":
             confirmation = self._save_dataframe(self.input, file_path, file_format)
-        elif self._get_input_type() == "Data":
+        elif input_type == "Data":
             confirmation = self._save_data(self.input, file_path, file_format)
-        elif self._get_input_type() == "Message":
+        elif input_type == "Message":
             confirmation = await self._save_message(self.input, file_path, file_format)
         else:
-            msg = f"Unsupported input type: {self._get_input_type()}"
+            msg = f"Unsupported input type: {input_type}"
             raise ValueError(msg)
 
         # Upload the saved file
@@ -100,34 +102,38 @@ class SaveToFileComponent(Component):
 
     def _get_input_type(self) -> str:
         """Determine the input type based on the provided input."""
-        # Use exact type checking (type() is) instead of isinstance() to avoid inheritance issues.
+        # Look up the exact type instead of using isinstance() to avoid inheritance issues.
         # Since Message inherits from Data, isinstance(message, Data) would return True for Message objects,
         # causing Message inputs to be incorrectly identified as Data type.
-        if type(self.input) is DataFrame:
-            return "DataFrame"
-        if type(self.input) is Message:
-            return "Message"
-        if type(self.input) is Data:
-            return "Data"
-        msg = f"Unsupported input type: {type(self.input)}"
-        raise ValueError(msg)
-
-    def _get_default_format(self) -> str:
+        input_type = self._INPUT_TYPE_NAMES.get(type(self.input))
+        if input_type is None:
+            msg = f"Unsupported input type: {type(self.input)}"
+            raise ValueError(msg)
+        return input_type
+
+    def _get_default_format(self, input_type: str | None = None) -> str:
         """Return the default file format based on input type."""
-        if self._get_input_type() == "DataFrame":
+        if input_type is None:
+            input_type = self._get_input_type()
+        if input_type == "DataFrame":
             return "csv"
-        if self._get_input_type() == "Data":
+        if input_type == "Data":
             return "json"
-        if self._get_input_type() == "Message":
+        if input_type == "Message":
             return "json"
         return "json"  # Fallback
 
+    def _get_file_extension(self, fmt: str) -> str:
+        """Return the file extension used for a file format."""
+        return "xlsx" if fmt == "excel" else fmt
+
     def _adjust_file_path_with_format(self, path: Path, fmt: str) -> Path:
         """Adjust the file path to include the correct extension."""
         file_extension = path.suffix.lower().lstrip(".")
-        if fmt == "excel":
-            return Path(f"{path}.xlsx").expanduser() if file_extension not in ["xlsx", "xls"] else path
-        return Path(f"{path}.{fmt}").expanduser() if file_extension != fmt else path
+        if fmt == "excel" and file_extension == "xls":
+            return path
+        expected_extension = self._get_file_extension(fmt)
+        return Path(f"{path}.{expected_extension}").expanduser() if file_extension != expected_extension else path
 
     async def _upload_file(self, file_path: Path) -> None:
         """Upload the saved file using the upload_user_file service."""
@@ -180,19 +186,19 @@ class SaveToFileComponent(Component):
             raise ValueError(msg)
         return f"Data saved successfully as '{path}'"
 
+    async def _get_message_text(self, message: Message) -> str:
+        """Return the text of a Message, consuming sync or async iterators."""
+        if message.text is None:
+            return ""
+        if isinstance(message.text, AsyncIterator):
+            return " ".join([str(item) async for item in message.text]).strip()
+        if isinstance(message.text, Iterator):
+            return " ".join(str(item) for item in message.text)
+        return str(message.text)
+
     async def _save_message(self, message: Message, path: Path, fmt: str) -> str:
         """Save a Message to the specified file format, handling async iterators."""
-        content = ""
-        if message.text is None:
-            content = ""
-        elif isinstance(message.text, AsyncIterator):
-            async for item in message.text:
-                content += str(item) + " "
-            content = content.strip()
-        elif isinstance(message.text, Iterator):
-            content = " ".join(str(item) for item in message.text)
-        else:
-            content = str(message.text)
+        content = await self._get_message_text(message)
 
         if fmt == "txt":
             path.write_text(content, encoding="utf-8")
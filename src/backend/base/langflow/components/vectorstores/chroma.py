@@ -97,25 +97,12 @@ class ChromaVectorStoreComponent(LCVectorStoreComponent):
         except ImportError as e:
             msg = "Could not import Chroma integration package. Please install it with `pip install langchain-chroma`."
             raise ImportError(msg) from e
-        # Chroma settings
-        chroma_settings = None
-        client = None
-        if self.chroma_server_host:
-            chroma_settings = Settings(
-                chroma_server_cors_allow_origins=self.chroma_server_cors_allow_origins or [],
-                chroma_server_host=self.chroma_server_host,
-                chroma_server_http_port=self.chroma_server_http_port or None,
-                chroma_server_grpc_port=self.chroma_server_grpc_port or None,
-                chroma_server_ssl_enabled=self.chroma_server_ssl_enabled,
-            )
-            client = Client(settings=chroma_settings)
-
         # Check persist_directory and expand it if it is a relative path
         persist_directory = self.resolve_path(self.persist_directory) if self.persist_directory is not None else None
 
         chroma = Chroma(
             persist_directory=persist_directory,
-            client=client,
+            client=self._build_chroma_client(Client),
             embedding_function=self.embedding,
             collection_name=self.collection_name,
         )
@@ -124,6 +111,19 @@ class ChromaVectorStoreComponent(LCVectorStoreComponent):
         self.status = chroma_collection_to_data(chroma.get(limit=self.limit))
         return chroma
 
+    def _build_chroma_client(self, client_class: type):
+        """Builds the client for a Chroma server, or returns None to let Chroma open the persist directory itself."""
+        if not self.chroma_server_host:
+            return None
+        chroma_settings = Settings(
+            chroma_server_cors_allow_origins=self.chroma_server_cors_allow_origins or [],
+            chroma_server_host=self.chroma_server_host,
+            chroma_server_http_port=self.chroma_server_http_port or None,
+            chroma_server_grpc_port=self.chroma_server_grpc_port or None,
+            chroma_server_ssl_enabled=self.chroma_server_ssl_enabled,
+        )
+        return client_class(settings=chroma_settings)
+
     def _add_documents_to_vector_store(self, vector_store: "Chroma") -> None:
         """Adds documents to the Vector Store."""
         ingest_data: list | Data | DataFrame = self.ingest_data
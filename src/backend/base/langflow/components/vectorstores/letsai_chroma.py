@@ -1,6 +1,10 @@
 from copy import deepcopy
-import json
+from functools import lru_cache
+import threading
+from typing import Any
 
+import orjson
+from chromadb import PersistentClient
 from chromadb.config import Settings
 from langchain_chroma import Chroma
 from typing_extensions import override
@@ -11,6 +15,26 @@ from langflow.components.vectorstores import ChromaVectorStoreComponent
 from langflow.io import BoolInput, DropdownInput, FloatInput, HandleInput, IntInput, MultilineInput, StrInput
 from langflow.schema import Data, DataFrame
 
+# Chroma clients are expensive to bootstrap, so one is shared per server/persist directory across runs.
+_CLIENT_CACHE: dict[tuple, Any] = {}
+_CLIENT_LOCK = threading.Lock()
+
+
+def _get_chroma_client(key: tuple, factory):
+    client = _CLIENT_CACHE.get(key)
+    if client is None:
+        with _CLIENT_LOCK:
+            client = _CLIENT_CACHE.get(key)
+            if client is None:
+                client = _CLIENT_CACHE[key] = factory()
+    return client
+
+
+@lru_cache(maxsize=128)
+def _parse_filter(raw_filter: str) -> dict:
+    """Parse a search filter once per distinct raw string; callers must not mutate the result."""
+    return orjson.loads(raw_filter)
+
 
 class LetsAIChromaVectorStoreComponent(ChromaVectorStoreComponent):
     """Custom Chroma Vector Store with enhanced search capabilities, including similarity+score and metadata filtering."""
@@ -50,14 +74,36 @@ class LetsAIChromaVectorStoreComponent(ChromaVectorStoreComponent):
         raw_filter = params.get("search_filter", "")
         if raw_filter:
             try:
-                self.advance_search_filter = json.loads(raw_filter)
-            except json.JSONDecodeError:
+                self.advance_search_filter = _parse_filter(raw_filter)
+            except orjson.JSONDecodeError:
                 raise ValueError("The 'search_filter' must be a valid JSON dictionary.")
         else:
             self.advance_search_filter = None
 
         self.simil_threshold = params.get("sim_threshold", 0.0)
 
+    @override
+    def _build_chroma_client(self, client_class: type):
+        """Returns a client shared across runs with the same connection settings."""
+        if self.chroma_server_host:
+            key = (
+                "server",
+                self.chroma_server_host,
+                self.chroma_server_http_port,
+                self.chroma_server_grpc_port,
+                self.chroma_server_ssl_enabled,
+                str(self.chroma_server_cors_allow_origins),
+            )
+            build_server_client = super()._build_chroma_client
+            return _get_chroma_client(key, lambda: build_server_client(client_class))
+        # Check persist_directory and expand it if it is a relative path
+        persist_directory = self.resolve_path(self.persist_directory) if self.persist_directory is not None else None
+        if persist_directory:
+            return _get_chroma_client(
+                ("persistent", persist_directory), lambda: PersistentClient(path=persist_directory)
+            )
+        return None
+
     @override
     def search_documents(self) -> list[Data]:
         """Search for documents in the vector store, with optional score and metadata filter."""
@@ -81,15 +127,11 @@ class LetsAIChromaVectorStoreComponent(ChromaVectorStoreComponent):
             docs_and_scores = vs.similarity_search_with_relevance_scores(
                 query, k=k, filter=filt if filt else None
             )
-            results: list[Data] = []
-            for doc, score in docs_and_scores:
-                if score >= threshold:
-                    data = Data(
-                        metadata={**getattr(doc, "metadata", {})},
-                        score={"score": score},
-                        text=doc.page_content,
-                    )
-                    results.append(data)
+            results: list[Data] = [
+                Data(metadata=dict(doc.metadata or {}), score={"score": score}, text=doc.page_content)
+                for doc, score in docs_and_scores
+                if score >= threshold
+            ]
             self.status = results
             return results
 
@@ -0,0 +1,66 @@
+import time
+from pathlib import Path
+from zipfile import ZipFile
+
+import pytest
+from langflow.base.data import BaseFileComponent
+from langflow.components.data.letsai_file import LetsAIFileComponent
+from langflow.schema import Data
+
+
+def test_parallel_failure_waits_for_running_files(monkeypatch, tmp_path):
+    finished = []
+
+    def process_file(self, file_path, *, silent_errors=False):  # noqa: ARG001
+        if file_path.endswith("bad.txt"):
+            msg = "cannot parse"
+            raise ValueError(msg)
+        time.sleep(0.2)
+        finished.append(file_path)
+        return Data(data={"file_path": file_path, "text": "ok"})
+
+    monkeypatch.setattr(LetsAIFileComponent, "_process_file", process_file)
+    paths = [tmp_path / name for name in ("bad.txt", "a.txt", "b.txt", "c.txt")]
+    files = [BaseFileComponent.BaseFile(Data(), path) for path in paths]
+    component = LetsAIFileComponent(silent_errors=False, use_multithreading=True, concurrency_multithreading=2)
+
+    with pytest.raises(ValueError, match="cannot parse"):
+        component.process_files(files)
+
+    # Every file that started must be done before the caller can clean up temporary files.
+    assert sorted(finished) == sorted(str(path) for path in paths[1:])
+
+
+def test_path_files_skips_files_that_fail_to_load(monkeypatch, tmp_path):
+    broken = tmp_path / "broken.json"
+    broken.write_text("{not json")
+    valid = tmp_path / "valid.txt"
+    valid.write_text("hello")
+    component = LetsAIFileComponent(silent_errors=True)
+    monkeypatch.setattr(
+        component,
+        "_validate_and_resolve_paths",
+        lambda: [BaseFileComponent.BaseFile(Data(), path) for path in (broken, valid)],
+    )
+
+    assert component.path_files().data == {"path": str(valid)}
+
+
+def test_load_files_base_cleans_up_when_processing_fails(monkeypatch, tmp_path):
+    bundle = tmp_path / "bundle.zip"
+    with ZipFile(bundle, "w") as archive:
+        archive.writestr("inner.txt", "hello")
+    component = LetsAIFileComponent(silent_errors=False)
+    monkeypatch.setattr(component, "_validate_and_resolve_paths", lambda: [BaseFileComponent.BaseFile(Data(), bundle)])
+
+    def process_files(_file_list):
+        msg = "processing failed"
+        raise RuntimeError(msg)
+
+    monkeypatch.setattr(component, "process_files", process_files)
+
+    with pytest.raises(RuntimeError, match="processing failed"):
+        component.load_files_base()
+
+    assert component._temp_dirs
+    assert not any(Path(temp_dir.name).exists() for temp_dir in component._temp_dirs)
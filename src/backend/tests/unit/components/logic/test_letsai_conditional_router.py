@@ -0,0 +1,31 @@
+import pytest
+from langflow.components.logic.conditional_router import ConditionalRouterComponent
+from langflow.components.logic.letsai_conditional_router import LetsAIConditionalRouterComponent
+
+
+@pytest.mark.parametrize(
+    ("input_text", "match_text", "operator", "case_sensitive"),
+    [
+        ("Hello World", "Hello World", "equals", True),
+        ("Hello World", "hello world", "equals", True),
+        ("Hello World", "hello world", "equals", False),
+        ("Hello World", "hello", "not equals", False),
+        ("Hello World", "lo Wo", "contains", True),
+        ("Hello World", "LO WO", "contains", False),
+        ("Hello World", "Hello", "starts with", True),
+        ("Hello World", "World", "ends with", True),
+        ("Hello World", "world", "ends with", False),
+        ("Hello World", r"H\w+", "regex", True),
+        ("Hello World", r"World", "regex", True),
+        ("Hello World", r"[unclosed", "regex", True),
+        ("Hello World", "Hello", "unknown", True),
+    ],
+)
+def test_evaluate_condition_matches_parent(input_text, match_text, operator, case_sensitive):
+    expected = ConditionalRouterComponent().evaluate_condition(
+        input_text, match_text, operator, case_sensitive=case_sensitive
+    )
+    result = LetsAIConditionalRouterComponent().evaluate_condition(
+        input_text, match_text, operator, case_sensitive=case_sensitive
+    )
+    assert result is expected
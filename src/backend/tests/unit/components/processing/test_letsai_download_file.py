@@ -0,0 +1,55 @@
+from tempfile import SpooledTemporaryFile
+
+import pandas as pd
+import pytest
+from langflow.components.processing import letsai_download_file
+from langflow.components.processing.letsai_download_file import LetsAISaveToFileComponent
+
+
+def test_large_dataframe_markdown_skips_tabulate(monkeypatch):
+    monkeypatch.setattr(letsai_download_file, "MARKDOWN_TABULATE_MAX_ROWS", 1)
+    df = pd.DataFrame({"name|alias": ["a|b", "multi\nline", None], "value": [1, 2, 3]})
+
+    with SpooledTemporaryFile() as buffer:
+        content = LetsAISaveToFileComponent()._generate_from_dataframe(df, "markdown", buffer)
+
+    assert content.decode("utf-8").splitlines() == [
+        "| name\\|alias | value |",
+        "|---|---|",
+        "| a\\|b | 1 |",
+        "| multi line | 2 |",
+        "|  | 3 |",
+    ]
+
+
+def test_csv_uses_arrow_for_plain_columns(monkeypatch):
+    df = pd.DataFrame({"id": [1, 2], "name": ["a", None]})
+    monkeypatch.setattr(pd.DataFrame, "to_csv", lambda *_args, **_kwargs: pytest.fail("pandas fallback used"))
+
+    with SpooledTemporaryFile() as buffer:
+        LetsAISaveToFileComponent()._write_csv(df, buffer)
+        buffer.seek(0)
+        content = buffer.read()
+
+    assert content == b"id,name\n1,a\n2,\n"
+
+
+@pytest.mark.parametrize(
+    "df",
+    [
+        # Arrow raises mid-write on values that need quoting, so the partial output must be discarded.
+        pd.DataFrame({"id": [1, 2], "name": ["a", "b, c"]}),
+        # Arrow writes booleans and floats differently from pandas, so these skip the Arrow path.
+        pd.DataFrame({"flag": [True, False], "score": [1.0, None]}),
+        # pandas writes one header row per column level.
+        pd.DataFrame([[1, 2]], columns=pd.MultiIndex.from_tuples([("a", "b"), ("a", "c")])),
+    ],
+)
+def test_csv_falls_back_to_pandas(df):
+    with SpooledTemporaryFile() as buffer:
+        buffer.write(b"prefix")
+        LetsAISaveToFileComponent()._write_csv(df, buffer)
+        buffer.seek(0)
+        content = buffer.read()
+
+    assert content == b"prefix" + df.to_csv(index=False).encode("utf-8")
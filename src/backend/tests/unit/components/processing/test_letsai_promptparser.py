@@ -0,0 +1,38 @@
+import orjson
+import pytest
+from langflow.components.processing.letsai_promptparser import PromptParserComponent
+from langflow.schema.message import Message
+
+
+@pytest.mark.parametrize(
+    ("text", "expected_prompt", "expected_path"),
+    [
+        ("Summarize this | docs/a.txt | docs/b.txt", "Summarize this", "docs/a.txt"),
+        ('Summarize this |  | "docs/a file.txt" ', "Summarize this", "docs/a file.txt"),
+        ("Only a prompt", "Only a prompt", None),
+        ("Prompt |   |  ", "Prompt", None),
+    ],
+)
+def test_prompt_and_first_path(text, expected_prompt, expected_path):
+    component = PromptParserComponent(message=Message(text=text))
+
+    assert component.get_prompt() == expected_prompt
+    payload = orjson.loads(component.get_paths().text)
+    if expected_path is None:
+        assert payload == {"error": "No paths found"}
+    else:
+        assert payload == {"path": expected_path}
+
+
+def test_get_file_paths_skips_blank_segments():
+    component = PromptParserComponent(message=Message(text="Prompt | a.txt |  | b.txt"))
+
+    assert component.get_file_paths().data == {"file_paths": ["/path/to/files/a.txt", "/path/to/files/b.txt"]}
+
+
+def test_long_blank_segment_is_skipped():
+    blank = " " * 50_000
+    component = PromptParserComponent(message=Message(text=f"Prompt |{blank}|{blank}| a.txt"))
+
+    assert orjson.loads(component.get_paths().text) == {"path": "a.txt"}
+    assert component.get_file_paths().data == {"file_paths": ["/path/to/files/a.txt"]}